@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Shared regression and SVG rendering helpers for the trend plot scripts."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+def linear_regression(xs: List[float], ys: List[float]) -> Tuple[float, float]:
+    # Single fused pass using Welford-style running means: one traversal
+    # instead of the four sum() scans of the naive form, and numerically
+    # stable for year-scale x values.
+    if len(xs) < 2:
+        return 0.0, ys[0] if ys else 0.0
+    n = 0
+    mean_x = mean_y = cov_xy = var_x = 0.0
+    for x, y in zip(xs, ys):
+        n += 1
+        dx = x - mean_x
+        mean_x += dx / n
+        mean_y += (y - mean_y) / n
+        cov_xy += dx * (y - mean_y)
+        var_x += dx * (x - mean_x)
+    if var_x == 0:
+        return 0.0, mean_y
+    slope = cov_xy / var_x
+    intercept = mean_y - slope * mean_x
+    return slope, intercept
+
+
+def _fmt1(v: float) -> str:
+    # One-decimal rendering via integer math; noticeably cheaper than the
+    # general dtoa path behind f"{v:.1f}" when emitted per coordinate.
+    i = round(v * 10)
+    q, r = divmod(abs(i), 10)
+    return f"-{q}.{r}" if i < 0 else f"{q}.{r}"
+
+
+def render_trend_svg(
+    out_path: Path,
+    years: List[int],
+    values: List[float],
+    slope: float,
+    intercept: float,
+    *,
+    title: str,
+    ylabel: str,
+    zero_line_color: str = "#98a59b",
+    zero_line_width: float = 1.2,
+    extra_line: Optional[float] = None,
+    extra_line_label: Optional[str] = None,
+) -> None:
+    """Write the standard yearly-anomaly trend plot.
+
+    ``extra_line`` draws a dashed horizontal reference at that y-value;
+    ``extra_line_label`` adds a footnote in the same color and can be
+    given on its own.
+    """
+    width, height = 980, 520
+    margin = {"l": 80, "r": 30, "t": 40, "b": 70}
+    plot_w = width - margin["l"] - margin["r"]
+    plot_h = height - margin["t"] - margin["b"]
+    bounds = values + [0.0]
+    if extra_line is not None:
+        bounds.append(extra_line)
+    y_min = min(bounds) - 3
+    y_max = max(bounds) + 3
+    if y_max <= y_min:
+        y_max = y_min + 1
+
+    def y_px(v: float) -> float:
+        return margin["t"] + (y_max - v) * (plot_h / (y_max - y_min))
+
+    # Transform each coordinate exactly once up front; every feature
+    # (polyline, trend, markers, labels) reuses the same pixel lists.
+    if len(years) == 1:
+        xs_px = [margin["l"] + plot_w / 2]
+    else:
+        x_scale = plot_w / (years[-1] - years[0])
+        xs_px = [margin["l"] + (y - years[0]) * x_scale for y in years]
+    y_scale = plot_h / (y_max - y_min)
+    ys_px = [margin["t"] + (y_max - v) * y_scale for v in values]
+    trend_ys_px = [margin["t"] + (y_max - (intercept + slope * y)) * y_scale for y in years]
+
+    # Each pixel coordinate is formatted exactly once; features below
+    # reuse the strings.
+    xs_s = [_fmt1(x) for x in xs_px]
+    ys_s = [_fmt1(y) for y in ys_px]
+    trend_ys_s = [_fmt1(y) for y in trend_ys_px]
+    points = " ".join(f"{x},{y}" for x, y in zip(xs_s, ys_s))
+    trend_points = " ".join(f"{x},{y}" for x, y in zip(xs_s, trend_ys_s))
+    zero_y = _fmt1(y_px(0.0))
+    extra_y = _fmt1(y_px(extra_line)) if extra_line is not None else None
+
+    y_ticks = 7
+    y_tick_lines = []
+    for i in range(y_ticks + 1):
+        val = y_min + i * (y_max - y_min) / y_ticks
+        py = y_px(val)
+        py_s = _fmt1(py)
+        y_tick_lines.append(
+            f'<line x1="{margin["l"]}" y1="{py_s}" x2="{width-margin["r"]}" y2="{py_s}" '
+            f'stroke="#e7e2d8" stroke-width="1" />'
+            f'<text x="{margin["l"]-10}" y="{_fmt1(py + 4)}" text-anchor="end" font-size="12" fill="#6b746c">{_fmt1(val)}</text>'
+        )
+
+    x_labels = []
+    for y, px in zip(years, xs_s):
+        x_labels.append(
+            f'<text x="{px}" y="{height-30}" text-anchor="middle" font-size="12" fill="#6b746c">{y}</text>'
+        )
+
+    # Classic string-builder: append fragments to one list and join once,
+    # instead of layering joins inside a giant f-string that copies the
+    # document several times over.
+    parts: List[str] = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">\n',
+        f'  <rect x="0" y="0" width="{width}" height="{height}" fill="#fdfbf6"/>\n',
+        f'  <text x="{width/2}" y="24" text-anchor="middle" font-size="20" font-family="Georgia, serif" fill="#233529">\n'
+        f"    {title}\n"
+        "  </text>\n"
+        "  ",
+    ]
+    parts.extend(y_tick_lines)
+    parts.append("\n")
+    parts.append(f'  <line x1="{margin["l"]}" y1="{zero_y}" x2="{width-margin["r"]}" y2="{zero_y}" stroke="{zero_line_color}" stroke-width="{zero_line_width}" />\n')
+    parts.append(f'  <polyline fill="none" stroke="#2c6a3f" stroke-width="3" points="{points}" />\n')
+    parts.append(f'  <polyline fill="none" stroke="#c46a3a" stroke-width="2.5" stroke-dasharray="7,5" points="{trend_points}" />\n')
+    if extra_y is not None:
+        parts.append(f'  <line x1="{margin["l"]}" y1="{extra_y}" x2="{width-margin["r"]}" y2="{extra_y}" stroke="#6b3fb0" stroke-width="2.5" stroke-dasharray="4,4" />\n')
+    parts.append("  ")
+    for x, y in zip(xs_s, ys_s):
+        parts.append(f'<circle cx="{x}" cy="{y}" r="4" fill="#2c6a3f"/>')
+    parts.append("\n")
+    parts.append(f'  <line x1="{margin["l"]}" y1="{height-margin["b"]}" x2="{width-margin["r"]}" y2="{height-margin["b"]}" stroke="#7f8b83" />\n')
+    parts.append(f'  <line x1="{margin["l"]}" y1="{margin["t"]}" x2="{margin["l"]}" y2="{height-margin["b"]}" stroke="#7f8b83" />\n')
+    parts.append("  ")
+    parts.extend(x_labels)
+    parts.append("\n")
+    parts.append(f'  <text x="{width/2}" y="{height-8}" text-anchor="middle" font-size="13" fill="#3f4c43">Year</text>\n')
+    parts.append(
+        f'  <text x="22" y="{height/2}" transform="rotate(-90 22,{height/2})" text-anchor="middle" font-size="13" fill="#3f4c43">\n'
+        f"    {ylabel}\n"
+        "  </text>\n"
+    )
+    parts.append(
+        f'  <text x="{width-16}" y="{margin["t"]+18}" text-anchor="end" font-size="12" fill="#c46a3a">\n'
+        f"    Trend slope: {slope:.2f} days/year\n"
+        "  </text>\n"
+    )
+    if extra_line_label is not None:
+        parts.append(
+            f'  <text x="{width-16}" y="{margin["t"]+36}" text-anchor="end" font-size="12" fill="#6b3fb0">\n'
+            f"    {extra_line_label}\n"
+            "  </text>\n"
+        )
+    parts.append("</svg>\n")
+    out_path.write_text("".join(parts), encoding="utf-8")
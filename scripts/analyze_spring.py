@@ -3,16 +3,21 @@
 
 from __future__ import annotations
 
+import argparse
+import gzip
+import hashlib
+import heapq
 import json
 import http.client
 import socket
 import math
 import re
-import statistics
+import threading
 import time
 import urllib.parse
 import urllib.request
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from html import escape
@@ -20,7 +25,23 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.error import HTTPError, URLError
 
-API_BASE = "https://api.inaturalist.org/v1"
+try:
+    # Optional: stream-parse large observation payloads without
+    # materializing the full response dict. Stdlib json is the fallback.
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional: fast native JSON encoder for the output artifacts.
+    import orjson
+except ImportError:
+    orjson = None
+
+API_HOST = "api.inaturalist.org"
+API_PATH = "/v1"
+API_BASE = f"https://{API_HOST}{API_PATH}"
+USER_AGENT = "wa-spring-indicator/1.0"
 WA_PLACE_ID = 46
 FLOWERING_TERM_ID = 12
 FLOWERING_VALUE_ID = 13
@@ -34,6 +55,20 @@ DEM_API_BASE = "https://api.opentopodata.org/v1/srtm90m"
 DEM_CACHE_FILENAME = "elevation_cache.json"
 DEM_COORD_PRECISION = 3
 DEM_MAX_NEW_LOOKUPS_PER_RUN = 1500
+FETCH_WORKERS = 6
+TAXA_PER_FETCH_BATCH = 8
+TAXA_CACHE_FILENAME = "taxa_cache.json"
+ETAG_CACHE_FILENAME = "etag_cache.json"
+PAGE_CACHE_DIRNAME = "page_cache"
+# Only the fields parse_observation and batch routing actually read.
+OBSERVATION_FIELDS = "id,observed_on,geojson,elevation,uri,place_guess,photos,taxon"
+
+_print_lock = threading.Lock()
+
+
+def log(message: str) -> None:
+    with _print_lock:
+        print(message, flush=True)
 
 # Candidate native/common spring indicators spanning WA climates.
 CANDIDATE_SPECIES = [
@@ -64,7 +99,7 @@ CANDIDATE_SPECIES = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     species: str
     taxon_id: int
@@ -77,30 +112,152 @@ class Observation:
     place_guess: Optional[str]
 
 
-def fetch_json(endpoint: str, params: Dict[str, object], pause_s: float = 0.12) -> Dict:
+# ETag revalidation cache for observation pages: unchanged pages come back
+# as 304 Not Modified and are served from gzipped payloads on disk.
+_DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+_PAGE_CACHE_DIR = _DATA_DIR / PAGE_CACHE_DIRNAME
+_etag_lock = threading.Lock()
+_etag_cache: Dict[str, str] = {}
+_etag_cache_loaded = False
+
+
+def _page_cache_file(url: str) -> Path:
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return _PAGE_CACHE_DIR / f"{digest}.json.gz"
+
+
+def _etag_lookup(url: str) -> Optional[str]:
+    global _etag_cache_loaded
+    with _etag_lock:
+        if not _etag_cache_loaded:
+            _etag_cache_loaded = True
+            path = _DATA_DIR / ETAG_CACHE_FILENAME
+            if path.exists():
+                try:
+                    raw = json.loads(path.read_text(encoding="utf-8"))
+                except (json.JSONDecodeError, OSError):
+                    raw = {}
+                if isinstance(raw, dict):
+                    _etag_cache.update({str(k): str(v) for k, v in raw.items()})
+        return _etag_cache.get(url)
+
+
+def _etag_store(url: str, etag: str, payload: Dict) -> None:
+    try:
+        _PAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _page_cache_file(url).write_bytes(
+            gzip.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        )
+    except OSError:
+        return
+    with _etag_lock:
+        _etag_cache[url] = etag
+
+
+def _etag_read_payload(url: str) -> Optional[Dict]:
+    try:
+        return json.loads(gzip.decompress(_page_cache_file(url).read_bytes()))
+    except (OSError, json.JSONDecodeError, gzip.BadGzipFile, EOFError):
+        return None
+
+
+def save_etag_cache() -> None:
+    with _etag_lock:
+        if not _etag_cache:
+            return
+        (_DATA_DIR / ETAG_CACHE_FILENAME).write_text(
+            json.dumps(_etag_cache, sort_keys=True, indent=1), encoding="utf-8"
+        )
+
+
+# One persistent API connection per worker thread: stdlib urllib opens a
+# fresh TCP+TLS session per request, which costs a handshake on every one
+# of the ~dozens of calls each run makes against the same host.
+_thread_conns = threading.local()
+
+
+def _api_connection(reset: bool = False) -> http.client.HTTPSConnection:
+    conn = getattr(_thread_conns, "conn", None)
+    if reset and conn is not None:
+        conn.close()
+        conn = None
+    if conn is None:
+        conn = http.client.HTTPSConnection(API_HOST, timeout=45)
+        _thread_conns.conn = conn
+    return conn
+
+
+def fetch_json(
+    endpoint: str,
+    params: Dict[str, object],
+    pause_s: float = 0.0,
+    results_only: bool = False,
+    use_etag_cache: bool = False,
+) -> Dict:
+    # Concurrent workers pace requests on their own, so no default pause is
+    # needed between calls; the 429 backoff below is the real throttle.
     query = urllib.parse.urlencode(params)
-    url = f"{API_BASE}/{endpoint}?{query}"
-    req = urllib.request.Request(url, headers={"User-Agent": "wa-spring-indicator/1.0"})
+    path = f"{API_PATH}/{endpoint}?{query}"
+    url = f"https://{API_HOST}{path}"
+    cached_etag = _etag_lookup(url) if use_etag_cache else None
 
     attempt = 0
+    reset = False
     while True:
         attempt += 1
         try:
-            with urllib.request.urlopen(req, timeout=45) as response:
-                payload = json.load(response)
-            time.sleep(pause_s)
-            return payload
-        except HTTPError as err:
-            if err.code == 429 and attempt < 7:
+            conn = _api_connection(reset=reset)
+            reset = False
+            headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+            if cached_etag:
+                headers["If-None-Match"] = cached_etag
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            if response.status == 304 and cached_etag:
+                response.read()
+                payload = _etag_read_payload(url)
+                if payload is not None:
+                    return payload
+                # Cached body went missing; refetch without the validator.
+                cached_etag = None
+                continue
+            if response.status == 429 and attempt < 7:
+                response.read()  # drain so the connection stays reusable
                 delay = min(60.0, 2.0 * attempt)
-                print(f"  - throttled by iNaturalist, retrying in {delay:.0f}s...", flush=True)
+                log(f"  - throttled by iNaturalist, retrying in {delay:.0f}s...")
                 time.sleep(delay)
                 continue
+            if response.status >= 400:
+                response.read()
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            # Observation pages compress roughly 5-10x, so ask for gzip and
+            # decompress on the fly; the stream stays incremental either way.
+            stream = response
+            if (response.getheader("Content-Encoding") or "").lower() == "gzip":
+                stream = gzip.GzipFile(fileobj=response)
+            if results_only and ijson is not None:
+                # Pull result records out of the stream one at a time so
+                # the surrounding payload dict is never built; big
+                # observation pages are mostly fields we discard anyway.
+                payload = {"results": list(ijson.items(stream, "results.item"))}
+            else:
+                payload = json.load(stream)
+            response.read()  # drain any trailing bytes to keep the connection alive
+            if use_etag_cache:
+                etag = response.getheader("ETag")
+                if etag:
+                    _etag_store(url, etag, payload)
+            if pause_s > 0:
+                time.sleep(pause_s)
+            return payload
+        except HTTPError:
             raise
-        except (URLError, http.client.RemoteDisconnected, TimeoutError, socket.timeout, ConnectionResetError):
+        except (http.client.HTTPException, TimeoutError, socket.timeout, OSError, ValueError):
+            # Stale keep-alive sockets surface as disconnects or truncated
+            # JSON; drop the cached connection and retry on a fresh one.
+            reset = True
             if attempt < 5:
-                delay = 1.5 * attempt
-                time.sleep(delay)
+                time.sleep(1.5 * attempt)
                 continue
             raise
 
@@ -136,16 +293,53 @@ def resolve_species_taxon(scientific_name: str) -> Optional[Dict]:
     return None
 
 
+def load_taxa_cache(path: Path) -> Dict[str, Dict]:
+    if not path.exists():
+        return {}
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    cache: Dict[str, Dict] = {}
+    for name, entry in raw.items():
+        if isinstance(entry, dict) and "taxon_id" in entry:
+            cache[str(name)] = entry
+    return cache
+
+
+def save_taxa_cache(path: Path, cache: Dict[str, Dict]) -> None:
+    path.write_text(json.dumps(cache, sort_keys=True, indent=1), encoding="utf-8")
+
+
+# Days before the first of each month in a non-leap year, indexed by month.
+_CUM_MONTH_DAYS = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def _fast_parse_iso_date(text: str) -> Optional[date]:
+    # datetime.strptime pays locale/format-machine overhead per call; the
+    # API always returns YYYY-MM-DD, so slice and convert directly.
+    try:
+        return date(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+    except ValueError:
+        return None
+
+
+# Shared read-only sentinel so records without geojson don't allocate a
+# throwaway default dict each.
+_EMPTY: Dict = {}
+
+
 def parse_observation(raw: Dict, species: str, taxon_id: int) -> Optional[Observation]:
     observed_on = raw.get("observed_on")
-    geojson = raw.get("geojson", {})
+    geojson = raw.get("geojson") or _EMPTY
     if not observed_on or "coordinates" not in geojson:
         return None
-    try:
-        obs_date = datetime.strptime(observed_on, "%Y-%m-%d").date()
-    except ValueError:
+    obs_date = _fast_parse_iso_date(observed_on)
+    if obs_date is None:
         return None
-    coords = geojson.get("coordinates", [])
+    coords = geojson["coordinates"]
     if len(coords) != 2:
         return None
     lon, lat = coords
@@ -154,6 +348,7 @@ def parse_observation(raw: Dict, species: str, taxon_id: int) -> Optional[Observ
         elev_m = float(elev) if elev is not None else None
     except (TypeError, ValueError):
         elev_m = None
+    photos = raw.get("photos")
     return Observation(
         species=species,
         taxon_id=taxon_id,
@@ -162,42 +357,153 @@ def parse_observation(raw: Dict, species: str, taxon_id: int) -> Optional[Observ
         lon=float(lon),
         elev_m=elev_m,
         uri=str(raw.get("uri") or f"https://www.inaturalist.org/observations/{raw.get('id')}"),
-        photo_url=(((raw.get("photos") or [{}])[0]).get("url") if raw.get("photos") else None),
+        photo_url=photos[0].get("url") if photos else None,
         place_guess=raw.get("place_guess"),
     )
 
 
-def fetch_species_observations(species: str, taxon_id: int) -> List[Observation]:
-    observations: List[Observation] = []
-    page = 1
-    while True:
-        payload = fetch_json(
-            "observations",
-            {
-                "taxon_id": taxon_id,
-                "place_id": WA_PLACE_ID,
-                "quality_grade": "research",
-                "iconic_taxa": "Plantae",
-                "term_id": FLOWERING_TERM_ID,
-                "term_value_id": FLOWERING_VALUE_ID,
-                "d1": f"{BASELINE_START_YEAR}-01-01",
-                "d2": f"{CURRENT_YEAR}-12-31",
-                "order_by": "observed_on",
-                "order": "asc",
-                "per_page": PER_PAGE,
-                "page": page,
-            },
+def fetch_batched_observations(
+    taxa: List[Tuple[str, int]],
+    d1: str,
+    d2: str,
+) -> Dict[int, List[Observation]]:
+    """Fetch observations for several taxa through one paginated query.
+
+    The API accepts comma-separated taxon_id values, so batching cuts the
+    HTTP round-trip count by the batch size. Records are routed back to
+    their species via the returned taxon id (or an ancestor id, for
+    records identified below species level).
+    """
+    species_by_taxon = {taxon_id: name for name, taxon_id in taxa}
+    observations: Dict[int, List[Observation]] = {taxon_id: [] for _, taxon_id in taxa}
+    taxon_param = ",".join(str(taxon_id) for _, taxon_id in taxa)
+    max_records = MAX_RECORDS_PER_SPECIES * len(taxa)
+
+    def page_params(page: int) -> Dict[str, object]:
+        return {
+            "taxon_id": taxon_param,
+            "place_id": WA_PLACE_ID,
+            "quality_grade": "research",
+            "iconic_taxa": "Plantae",
+            "term_id": FLOWERING_TERM_ID,
+            "term_value_id": FLOWERING_VALUE_ID,
+            "d1": d1,
+            "d2": d2,
+            "order_by": "observed_on",
+            "order": "asc",
+            "per_page": PER_PAGE,
+            "page": page,
+            "fields": OBSERVATION_FIELDS,
+        }
+
+    # Page 1 is parsed in full so total_results bounds the pagination up
+    # front; the remaining pages are then fetched concurrently instead of
+    # serially waiting on each to decide whether another exists.
+    first = fetch_json("observations", page_params(1), use_etag_cache=True)
+    result_pages = [first.get("results", [])]
+    total = int(first.get("total_results") or 0)
+    num_pages = min(math.ceil(total / PER_PAGE), math.ceil(max_records / PER_PAGE)) if total else 1
+    # The v1 API rejects any request where page * per_page passes 10,000,
+    # so pagination is clamped to that window; anything beyond it is
+    # unreachable through this endpoint.
+    max_api_pages = 10000 // PER_PAGE
+    if num_pages > max_api_pages:
+        log(
+            f"  - batch of {len(taxa)} taxa totals {total} records; "
+            f"truncating to the first {max_api_pages * PER_PAGE} reachable"
         )
-        results = payload.get("results", [])
+        num_pages = max_api_pages
+    if num_pages > 1:
+        def fetch_page(page: int) -> List[Dict]:
+            payload = fetch_json(
+                "observations", page_params(page), results_only=True, use_etag_cache=True
+            )
+            return payload.get("results", [])
+
+        # A dedicated small pool per batch: reusing the outer species
+        # executor from inside one of its own workers can deadlock once
+        # every worker is waiting on queued page tasks.
+        with ThreadPoolExecutor(max_workers=4) as page_pool:
+            result_pages.extend(page_pool.map(fetch_page, range(2, num_pages + 1)))
+
+    for results in result_pages:
         for raw in results:
-            parsed = parse_observation(raw, species, taxon_id)
+            taxon = raw.get("taxon") or {}
+            taxon_id = taxon.get("id")
+            if taxon_id not in species_by_taxon:
+                taxon_id = next(
+                    (a for a in taxon.get("ancestor_ids") or [] if a in species_by_taxon),
+                    None,
+                )
+                if taxon_id is None:
+                    continue
+            # Enforce the per-species cap during routing; the page-count
+            # bound above only limits the batch as a whole.
+            bucket = observations[taxon_id]
+            if len(bucket) >= MAX_RECORDS_PER_SPECIES:
+                continue
+            parsed = parse_observation(raw, species_by_taxon[taxon_id], taxon_id)
             if parsed:
-                observations.append(parsed)
-        if not results or len(results) < PER_PAGE:
-            break
-        if len(observations) >= MAX_RECORDS_PER_SPECIES:
-            break
-        page += 1
+                bucket.append(parsed)
+    return observations
+
+
+def observation_cache_file(cache_dir: Path, taxon_id: int) -> Path:
+    return cache_dir / f"obs_{taxon_id}_{BASELINE_START_YEAR}_{BASELINE_END_YEAR}.json.gz"
+
+
+def save_observation_cache(cache_dir: Path, taxon_id: int, observations: List[Observation]) -> None:
+    rows = [
+        {
+            "species": obs.species,
+            "taxon_id": obs.taxon_id,
+            "observed_on": obs.observed_on.isoformat(),
+            "lat": obs.lat,
+            "lon": obs.lon,
+            "elev_m": obs.elev_m,
+            "uri": obs.uri,
+            "photo_url": obs.photo_url,
+            "place_guess": obs.place_guess,
+        }
+        for obs in observations
+    ]
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        observation_cache_file(cache_dir, taxon_id).write_bytes(
+            gzip.compress(json.dumps(rows, separators=(",", ":")).encode("utf-8"))
+        )
+    except OSError:
+        pass
+
+
+def load_observation_cache(cache_dir: Path, taxon_id: int) -> Optional[List[Observation]]:
+    path = observation_cache_file(cache_dir, taxon_id)
+    if not path.exists():
+        return None
+    try:
+        rows = json.loads(gzip.decompress(path.read_bytes()))
+    except (OSError, json.JSONDecodeError, gzip.BadGzipFile, EOFError):
+        return None
+    if not isinstance(rows, list):
+        return None
+    observations: List[Observation] = []
+    for row in rows:
+        obs_date = _fast_parse_iso_date(str(row.get("observed_on", "")))
+        if obs_date is None:
+            return None
+        observations.append(
+            Observation(
+                species=str(row["species"]),
+                taxon_id=int(row["taxon_id"]),
+                observed_on=obs_date,
+                lat=float(row["lat"]),
+                lon=float(row["lon"]),
+                elev_m=float(row["elev_m"]) if row.get("elev_m") is not None else None,
+                uri=str(row["uri"]),
+                photo_url=row.get("photo_url"),
+                place_guess=row.get("place_guess"),
+            )
+        )
     return observations
 
 
@@ -322,9 +628,42 @@ def fill_missing_elevations_from_dem(
     return new_lookups, filled
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
 def slugify(text: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
-    return slug or "species"
+    return _SLUG_RE.sub("-", text.lower()).strip("-") or "species"
+
+
+# Constant species-page scaffolding, hoisted so the render loop only
+# formats the parts that actually vary per species.
+_PAGE_PREFIX = """<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>"""
+
+_PAGE_HEAD_SUFFIX = """ | WA Spring Bloom Watch</title>
+  <style>
+    body { margin: 0; font-family: Georgia, 'Times New Roman', serif; background:#f4f2ea; color:#1f2e22; }
+    .wrap { width:min(900px,92vw); margin:1.5rem auto 3rem; }
+    .card { background:#fffdf8; border:1px solid #ddd7c8; border-radius:16px; padding:1rem; }
+    .meta { color:#5e665f; }
+    a { color:#245f39; }
+  </style>
+</head>
+<body>
+  <main class="wrap">
+    <p><a href="../index.html">Back to dashboard</a></p>
+    <section class="card">
+"""
+
+_PAGE_SUFFIX = """    </section>
+  </main>
+</body>
+</html>
+"""
 
 
 def render_species_pages(project_root: Path, output: Dict) -> None:
@@ -347,23 +686,29 @@ def render_species_pages(project_root: Path, output: Dict) -> None:
         if expected_doy is not None:
             expected_date = date(output["years"]["current_year"], 1, 1) + timedelta(days=max(0, int(round(expected_doy)) - 1))
             expected_date_text = expected_date.strftime("%B %-d")
+        # Escape each repeated value once up front; common_name alone is
+        # interpolated three times per page.
+        common = escape(species["common_name"])
+        sci = escape(species["species"])
+        status = escape(species["status"])
+        granularity = escape(species["granularity"])
         photo_html = (
-            f'<img src="{escape(species["photo_url"])}" alt="{escape(species["common_name"])}" '
+            f'<img src="{escape(species["photo_url"])}" alt="{common}" '
             'style="max-width:100%;border-radius:12px;border:1px solid #ddd;" />'
             if species.get("photo_url")
             else '<div style="padding:1rem;background:#f3f3f3;border-radius:12px;">No photo available</div>'
         )
         obs_list = species.get("current_year_observations", [])
         if obs_list:
-            links = "\n".join(
-                (
+            link_parts = []
+            for obs in obs_list:
+                place = obs.get("place_guess")
+                suffix = " - " + escape(place) if place else ""
+                link_parts.append(
                     f'<li><a href="{escape(obs["uri"])}" target="_blank" rel="noopener">'
-                    f'{escape(obs["observed_on"])}'
-                    f"{' - ' + escape(obs['place_guess']) if obs.get('place_guess') else ''}"
-                    "</a></li>"
+                    f'{escape(obs["observed_on"])}{suffix}</a></li>'
                 )
-                for obs in obs_list
-            )
+            links = "\n".join(link_parts)
             obs_html = (
                 "<p>This species has flowering observations this year.</p>"
                 f"<ul>{links}</ul>"
@@ -382,28 +727,10 @@ def render_species_pages(project_root: Path, output: Dict) -> None:
             f"term_id={FLOWERING_TERM_ID}&term_value_id={FLOWERING_VALUE_ID}&"
             f"d1={year}-01-01&d2={year}-12-31"
         )
-        html = f"""<!doctype html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>{escape(species['common_name'])} | WA Spring Bloom Watch</title>
-  <style>
-    body {{ margin: 0; font-family: Georgia, 'Times New Roman', serif; background:#f4f2ea; color:#1f2e22; }}
-    .wrap {{ width:min(900px,92vw); margin:1.5rem auto 3rem; }}
-    .card {{ background:#fffdf8; border:1px solid #ddd7c8; border-radius:16px; padding:1rem; }}
-    .meta {{ color:#5e665f; }}
-    a {{ color:#245f39; }}
-  </style>
-</head>
-<body>
-  <main class="wrap">
-    <p><a href="../index.html">Back to dashboard</a></p>
-    <section class="card">
-      <h1>{escape(species['common_name'])}</h1>
-      <p class="meta"><em>{escape(species['species'])}</em></p>
+        body = f"""      <h1>{common}</h1>
+      <p class="meta"><em>{sci}</em></p>
       {photo_html}
-      <p class="meta">Status: <strong>{escape(species['status'])}</strong> | Anomaly: {species['anomaly_days']} days | Data granularity: {escape(species['granularity'])}</p>
+      <p class="meta">Status: <strong>{status}</strong> | Anomaly: {species['anomaly_days']} days | Data granularity: {granularity}</p>
       <p class="meta"><strong>Expected flowering onset:</strong> {escape(expected_date_text)} (baseline from prior years)</p>
       <p><a href="{escape(species['taxon_url'])}" target="_blank" rel="noopener">View taxon on iNaturalist</a></p>
       <p><a href="{escape(all_search_url)}" target="_blank" rel="noopener">View all {year} flowering observations in Washington</a></p>
@@ -411,31 +738,43 @@ def render_species_pages(project_root: Path, output: Dict) -> None:
       <p><a href="{escape(fna_url)}" target="_blank" rel="noopener">Flora of North America species description</a></p>
       <h2>This Year's Flowering Observations</h2>
       {obs_html}
-    </section>
-  </main>
-</body>
-</html>
 """
-        page_path.write_text(html, encoding="utf-8")
+        html = "".join((_PAGE_PREFIX, common, _PAGE_HEAD_SUFFIX, body, _PAGE_SUFFIX))
+        page_path.write_bytes(html.encode("utf-8"))
 
 
 def percentile(values: List[float], p: float) -> float:
     if not values:
         raise ValueError("percentile() requires non-empty values")
-    if len(values) == 1:
+    n = len(values)
+    if n == 1:
         return float(values[0])
-    seq = sorted(values)
-    idx = (len(seq) - 1) * p
+    idx = (n - 1) * p
     lo = math.floor(idx)
     hi = math.ceil(idx)
+    if hi + 1 < n:
+        # Only the hi+1 smallest values matter for a low quantile (this
+        # project mostly asks for p=0.2), so partial selection beats a
+        # full sort: O(n log k) instead of O(n log n).
+        seq = heapq.nsmallest(hi + 1, values)
+    else:
+        seq = sorted(values)
     if lo == hi:
         return float(seq[int(idx)])
     frac = idx - lo
     return float(seq[lo] * (1 - frac) + seq[hi] * frac)
 
 
+def day_of_year_ymd(year: int, month: int, day: int) -> int:
+    doy = _CUM_MONTH_DAYS[month] + day
+    if month > 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        doy += 1
+    return doy
+
+
 def day_of_year(d: date) -> int:
-    return d.timetuple().tm_yday
+    # Avoids allocating a struct_time via d.timetuple() in hot loops.
+    return day_of_year_ymd(d.year, d.month, d.day)
 
 
 def cascade_divide_lon(lat: float) -> float:
@@ -473,45 +812,74 @@ def summarize_species(
     photo_url: Optional[str],
     observations: List[Observation],
 ) -> Optional[Dict]:
-    by_zone_year: Dict[str, Dict[int, List[int]]] = defaultdict(lambda: defaultdict(list))
-    by_side_year: Dict[str, Dict[int, List[int]]] = defaultdict(lambda: defaultdict(list))
-    by_state_year: Dict[int, List[int]] = defaultdict(list)
-    current_obs_by_zone: Dict[str, int] = defaultdict(int)
-    current_obs_by_side: Dict[str, int] = defaultdict(int)
-    current_obs_state = 0
+    # Flat (group, year)-keyed dict: one hash probe per insert instead of
+    # the two (plus a lambda call on misses) that nested defaultdicts cost.
+    # Only the finest granularity is built per observation; side and
+    # statewide aggregates are derived from it below.
+    by_zone_year: Dict[Tuple[str, int], List[int]] = {}
+    current_zone_labels: List[str] = []
     current_obs_records: List[Observation] = []
 
+    current_year = CURRENT_YEAR
+    current_date = CURRENT_DATE
     for obs in observations:
-        side = side_of_cascades(obs.lat, obs.lon)
-        zone = f"{side}-{elevation_band(obs.elev_m)}"
-        doy = day_of_year(obs.observed_on)
-        by_zone_year[zone][obs.observed_on.year].append(doy)
-        by_side_year[side][obs.observed_on.year].append(doy)
-        by_state_year[obs.observed_on.year].append(doy)
-        if obs.observed_on.year == CURRENT_YEAR and obs.observed_on <= CURRENT_DATE:
-            current_obs_by_zone[zone] += 1
-            current_obs_by_side[side] += 1
-            current_obs_state += 1
+        observed_on = obs.observed_on
+        year = observed_on.year
+        # Inlined from side_of_cascades()/elevation_band(); keep the crest
+        # approximation and band thresholds in sync with those helpers.
+        side = "east" if obs.lon > -121.80 + (obs.lat - 45.5) * 0.14 else "west"
+        elev_m = obs.elev_m
+        if elev_m is None:
+            band = "unknown"
+        elif elev_m < 500:
+            band = "low"
+        elif elev_m < 1200:
+            band = "mid"
+        else:
+            band = "high"
+        zone = f"{side}-{band}"
+        doy = day_of_year_ymd(year, observed_on.month, observed_on.day)
+        by_zone_year.setdefault((zone, year), []).append(doy)
+        if year == current_year and observed_on <= current_date:
+            current_zone_labels.append(zone)
             current_obs_records.append(obs)
 
+    # One linear pass over the compact zone map (a few dozen entries)
+    # replaces two extra dict inserts per observation in the loop above.
+    by_side_year: Dict[Tuple[str, int], List[int]] = {}
+    by_state_year: Dict[Tuple[str, int], List[int]] = {}
+    for (zone, year), doys in by_zone_year.items():
+        side = zone.split("-", 1)[0]
+        by_side_year.setdefault((side, year), []).extend(doys)
+        by_state_year.setdefault(("statewide", year), []).extend(doys)
+    # One C-level Counter pass over the collected labels instead of a
+    # dict increment per observation inside the loop.
+    current_obs_by_zone = Counter(current_zone_labels)
+    current_obs_by_side: Counter = Counter()
+    for zone, count in current_obs_by_zone.items():
+        current_obs_by_side[zone.split("-", 1)[0]] += count
+    current_obs_state = len(current_zone_labels)
+
     def eval_groups(
-        year_maps: Dict[str, Dict[int, List[int]]],
+        year_maps: Dict[Tuple[str, int], List[int]],
         current_obs_map: Dict[str, int],
         min_year_obs: int,
         min_baseline_years: int,
     ) -> List[Dict]:
         rows: List[Dict] = []
         today_doy = day_of_year(CURRENT_DATE)
-        for group_name, year_map in year_maps.items():
+        for group_name in sorted({group for group, _ in year_maps}):
             baseline_onsets: List[float] = []
             for year in range(BASELINE_START_YEAR, BASELINE_END_YEAR + 1):
-                doys = year_map.get(year, [])
+                doys = year_maps.get((group_name, year), [])
                 if len(doys) >= min_year_obs:
                     baseline_onsets.append(percentile(doys, 0.2))
-            current_doys = year_map.get(CURRENT_YEAR, [])
+            current_doys = year_maps.get((group_name, CURRENT_YEAR), [])
             if len(baseline_onsets) < min_baseline_years:
                 continue
-            baseline_doy = statistics.median(baseline_onsets)
+            # percentile(..., 0.5) is exactly the median and reuses the
+            # selection-based helper, so stdlib statistics isn't needed.
+            baseline_doy = percentile(baseline_onsets, 0.5)
             has_current = len(current_doys) >= 1
             if has_current:
                 current_doy = percentile(current_doys, 0.2)
@@ -548,7 +916,7 @@ def summarize_species(
         min_baseline_years=4,
     )
     state_results = eval_groups(
-        {"statewide": by_state_year},
+        by_state_year,
         {"statewide": current_obs_state},
         min_year_obs=2,
         min_baseline_years=4,
@@ -578,23 +946,28 @@ def summarize_species(
     else:
         return None
 
-    weighted_anomaly_numer = 0.0
-    weighted_anomaly_denom = 0.0
+    # Collect terms and reduce with math.fsum: one C-level pass each and
+    # no accumulated float rounding, unlike repeated `+=`.
+    anomaly_terms: List[float] = []
+    anomaly_weights: List[float] = []
     has_current_zone = False
     has_late_without_current = False
     for zone in zone_results:
         if zone["has_current"]:
             has_current_zone = True
             weight = max(1, zone["baseline_years"]) * max(1, zone["current_obs"])
-            weighted_anomaly_numer += zone["anomaly_days"] * weight
-            weighted_anomaly_denom += weight
         elif zone["status"] == "late":
             has_late_without_current = True
             weight = max(1, zone["baseline_years"])
-            weighted_anomaly_numer += zone["anomaly_days"] * weight
-            weighted_anomaly_denom += weight
+        else:
+            continue
+        anomaly_terms.append(zone["anomaly_days"] * weight)
+        anomaly_weights.append(weight)
 
-    species_anomaly = weighted_anomaly_numer / weighted_anomaly_denom if weighted_anomaly_denom else 0.0
+    weighted_anomaly_denom = math.fsum(anomaly_weights)
+    species_anomaly = (
+        math.fsum(anomaly_terms) / weighted_anomaly_denom if weighted_anomaly_denom else 0.0
+    )
     if has_current_zone:
         species_status = classify_status(species_anomaly)
     elif has_late_without_current:
@@ -650,8 +1023,8 @@ def build_zone_summary(indicators: List[Dict]) -> List[Dict]:
             zone_data[zone["zone"]].append((zone["anomaly_days"], weight))
     rows = []
     for zone, values in zone_data.items():
-        numer = sum(v * w for v, w in values)
-        denom = sum(w for _, w in values)
+        numer = math.fsum(v * w for v, w in values)
+        denom = math.fsum(w for _, w in values)
         anomaly = numer / denom if denom else 0.0
         rows.append(
             {
@@ -665,15 +1038,16 @@ def build_zone_summary(indicators: List[Dict]) -> List[Dict]:
 
 
 def overall_status(indicators: List[Dict]) -> Dict:
-    numer = 0.0
-    denom = 0.0
+    terms: List[float] = []
+    weights: List[float] = []
     for species in indicators:
         if species.get("status") == "pending":
             continue
         weight = max(1, species["zones_used"]) * max(1, species["current_obs_total"])
-        numer += species["anomaly_days"] * weight
-        denom += weight
-    anomaly = numer / denom if denom else 0.0
+        terms.append(species["anomaly_days"] * weight)
+        weights.append(weight)
+    denom = math.fsum(weights)
+    anomaly = math.fsum(terms) / denom if denom else 0.0
     return {
         "status": classify_status(anomaly),
         "anomaly_days": round(anomaly, 2),
@@ -690,29 +1064,112 @@ def overall_status(indicators: List[Dict]) -> Dict:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--refresh-taxa",
+        action="store_true",
+        help="ignore the on-disk taxon cache and re-resolve every species",
+    )
+    args = parser.parse_args()
+
     project_root = Path(__file__).resolve().parents[1]
     data_dir = project_root / "data"
     data_dir.mkdir(parents=True, exist_ok=True)
     elevation_cache_path = data_dir / DEM_CACHE_FILENAME
     elevation_cache = load_elevation_cache(elevation_cache_path)
+    taxa_cache_path = data_dir / TAXA_CACHE_FILENAME
+    taxa_cache = {} if args.refresh_taxa else load_taxa_cache(taxa_cache_path)
     remaining_dem_lookups = DEM_MAX_NEW_LOOKUPS_PER_RUN
 
     species_summaries: List[Dict] = []
     unresolved_species: List[str] = []
 
-    for species in CANDIDATE_SPECIES:
-        print(f"Resolving {species}...", flush=True)
+    taxa_lock = threading.Lock()
+
+    def resolve_candidate(species: str) -> Tuple[str, Optional[Dict]]:
+        with taxa_lock:
+            resolved = taxa_cache.get(species)
+        if resolved:
+            log(f"Resolving {species}... (cached taxon {resolved['taxon_id']})")
+            return species, resolved
+        log(f"Resolving {species}...")
         resolved = resolve_species_taxon(species)
+        if resolved:
+            # Taxon IDs are stable, so cache hits never expire.
+            with taxa_lock:
+                taxa_cache[species] = resolved
+        else:
+            log(f"  - {species}: unresolved")
+        return species, resolved
+
+    resolved_by_species: Dict[str, Optional[Dict]] = {}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = [executor.submit(resolve_candidate, s) for s in CANDIDATE_SPECIES]
+        for future in as_completed(futures):
+            species, resolved = future.result()
+            resolved_by_species[species] = resolved
+
+    # Batch resolved taxa into grouped observation queries; each batch is
+    # one paginated request stream instead of one per species.
+    resolved_candidates = [
+        (species, resolved_by_species[species]["taxon_id"])
+        for species in CANDIDATE_SPECIES
+        if resolved_by_species[species]
+    ]
+
+    def batched(pairs: List[Tuple[str, int]]) -> List[List[Tuple[str, int]]]:
+        return [pairs[i:i + TAXA_PER_FETCH_BATCH] for i in range(0, len(pairs), TAXA_PER_FETCH_BATCH)]
+
+    # Baseline years are immutable, so their observations are served from
+    # the on-disk cache when present; only the current-year slice (plus
+    # any baseline not yet cached) goes over the network.
+    cache_dir = data_dir / "cache"
+    baseline_by_taxon: Dict[int, List[Observation]] = {}
+    uncached_baseline: List[Tuple[str, int]] = []
+    for species, taxon_id in resolved_candidates:
+        cached = load_observation_cache(cache_dir, taxon_id)
+        if cached is None:
+            uncached_baseline.append((species, taxon_id))
+        else:
+            baseline_by_taxon[taxon_id] = cached
+    if baseline_by_taxon:
+        print(f"Baseline cache: {len(baseline_by_taxon)} species served from disk", flush=True)
+
+    baseline_d1 = f"{BASELINE_START_YEAR}-01-01"
+    baseline_d2 = f"{BASELINE_END_YEAR}-12-31"
+    current_d1 = f"{CURRENT_YEAR}-01-01"
+    current_d2 = f"{CURRENT_YEAR}-12-31"
+    current_by_taxon: Dict[int, List[Observation]] = {}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        baseline_futures = [
+            executor.submit(fetch_batched_observations, batch, baseline_d1, baseline_d2)
+            for batch in batched(uncached_baseline)
+        ]
+        current_futures = [
+            executor.submit(fetch_batched_observations, batch, current_d1, current_d2)
+            for batch in batched(resolved_candidates)
+        ]
+        for future in as_completed(baseline_futures):
+            for taxon_id, fetched in future.result().items():
+                baseline_by_taxon[taxon_id] = fetched
+                save_observation_cache(cache_dir, taxon_id, fetched)
+        for future in as_completed(current_futures):
+            current_by_taxon.update(future.result())
+
+    observations_by_taxon: Dict[int, List[Observation]] = {
+        taxon_id: baseline_by_taxon.get(taxon_id, []) + current_by_taxon.get(taxon_id, [])
+        for _, taxon_id in resolved_candidates
+    }
+
+    # Summaries run serially in candidate order so output (and the shared
+    # DEM lookup budget) stays deterministic across runs.
+    for species in CANDIDATE_SPECIES:
+        resolved = resolved_by_species[species]
         if not resolved:
             unresolved_species.append(species)
-            print(f"  - unresolved", flush=True)
             continue
         taxon_id = resolved["taxon_id"]
-        common_name = resolved["common_name"]
-        taxon_url = resolved["taxon_url"]
-        photo_url = resolved["photo_url"]
-        print(f"  - fetching observations (taxon {taxon_id})", flush=True)
-        observations = fetch_species_observations(species, taxon_id)
+        observations = observations_by_taxon.get(taxon_id, [])
         if remaining_dem_lookups > 0:
             new_lookups, filled = fill_missing_elevations_from_dem(
                 observations,
@@ -722,24 +1179,24 @@ def main() -> None:
             remaining_dem_lookups -= new_lookups
             if new_lookups or filled:
                 print(
-                    f"  - DEM elevation: {filled} filled from cache/API, {new_lookups} new lookups "
-                    f"(remaining budget {remaining_dem_lookups})",
+                    f"  - {species}: DEM elevation: {filled} filled from cache/API, "
+                    f"{new_lookups} new lookups (remaining budget {remaining_dem_lookups})",
                     flush=True,
                 )
         summary = summarize_species(
             species,
-            common_name,
+            resolved["common_name"],
             taxon_id,
-            taxon_url,
-            photo_url,
+            resolved["taxon_url"],
+            resolved["photo_url"],
             observations,
         )
         if summary:
             summary["observation_count"] = len(observations)
             species_summaries.append(summary)
-            print(f"  - usable: {len(observations)} observations, {summary['zones_used']} zones", flush=True)
+            print(f"  - {species}: usable: {len(observations)} observations, {summary['zones_used']} zones", flush=True)
         else:
-            print(f"  - skipped: insufficient usable zone/year coverage ({len(observations)} observations)", flush=True)
+            print(f"  - {species}: skipped: insufficient usable zone/year coverage ({len(observations)} observations)", flush=True)
 
     indicators = pick_indicator_species(species_summaries, limit=len(CANDIDATE_SPECIES))
     zones = build_zone_summary(indicators)
@@ -777,12 +1234,18 @@ def main() -> None:
 
     json_path = data_dir / "spring_status.json"
     js_path = data_dir / "spring_status.js"
-    json_path.write_text(json.dumps(output, indent=2), encoding="utf-8")
-    js_path.write_text(
-        "window.SPRING_STATUS = " + json.dumps(output, separators=(",", ":")) + ";\n",
-        encoding="utf-8",
-    )
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+        js_path.write_bytes(b"window.SPRING_STATUS = " + orjson.dumps(output) + b";\n")
+    else:
+        json_path.write_text(json.dumps(output, indent=2), encoding="utf-8")
+        js_path.write_text(
+            "window.SPRING_STATUS = " + json.dumps(output, separators=(",", ":")) + ";\n",
+            encoding="utf-8",
+        )
     save_elevation_cache(elevation_cache_path, elevation_cache)
+    save_taxa_cache(taxa_cache_path, taxa_cache)
+    save_etag_cache()
     render_species_pages(project_root, output)
     print(f"Wrote {json_path}")
     print(f"Wrote {js_path}")
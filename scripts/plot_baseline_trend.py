@@ -4,80 +4,170 @@
 from __future__ import annotations
 
 import csv
+import gzip
 import io
 import json
 import math
+import multiprocessing
 import socket
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from statistics import median, stdev
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
+from _plotutil import linear_regression, render_trend_svg
 from analyze_spring import (
     FLOWERING_TERM_ID,
     FLOWERING_VALUE_ID,
     PER_PAGE,
     WA_PLACE_ID,
+    day_of_year,
+    day_of_year_ymd,
     fetch_json,
-    parse_observation,
+    load_observation_cache,
     percentile,
 )
 
 MIN_OBS_PER_YEAR = 3
 MAX_RECORDS_PER_SPECIES = 2000
 HERBARIUM_BASE = "https://www.pnwherbaria.org/data/results.php"
+# Keep iNaturalist concurrency low to respect their rate limit; the
+# herbarium endpoint tolerates more parallel readers.
+INAT_FETCH_WORKERS = 3
+HERBARIUM_FETCH_WORKERS = 8
+# Historical records still gain entries over time (new CPNWH
+# digitizations, iNat observations promoted to research grade), so cached
+# lists are refreshed monthly.
+CACHE_MAX_AGE_DAYS = 30
+
+
+def _herbarium_cache_file(cache_dir: Path, species_name: str, start_year: int, end_year: int) -> Path:
+    slug = species_name.lower().replace(" ", "_")
+    return cache_dir / f"herb_doys_{slug}_{start_year}_{end_year}.json"
+
+
+def _inat_cache_file(cache_dir: Path, taxon_id: int, d1: str, d2: str) -> Path:
+    return cache_dir / f"inat_year_doys_{taxon_id}_{d1}_{d2}.json"
+
+
+def _load_json_cache(path: Path) -> Optional[List]:
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_MAX_AGE_DAYS * 86400:
+            return None
+        rows = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return rows if isinstance(rows, list) else None
+
+
+def _save_json_cache(path: Path, doys: List) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(doys, separators=(",", ":")), encoding="utf-8")
+    except OSError:
+        pass
 
 
 def fetch_species_observations_for_baseline(
     species_name: str, taxon_id: int, d1: str, d2: str
-) -> List:
-    observations = []
-    page = 1
-    while True:
-        payload = fetch_json(
-            "observations",
-            {
-                "taxon_id": taxon_id,
-                "place_id": WA_PLACE_ID,
-                "quality_grade": "research",
-                "iconic_taxa": "Plantae",
-                "term_id": FLOWERING_TERM_ID,
-                "term_value_id": FLOWERING_VALUE_ID,
-                "d1": d1,
-                "d2": d2,
-                "order_by": "observed_on",
-                "order": "asc",
-                "per_page": PER_PAGE,
-                "page": page,
-            },
-        )
-        results = payload.get("results", [])
-        for raw in results:
-            parsed = parse_observation(raw, species_name, taxon_id)
-            if parsed:
-                observations.append(parsed)
-        if not results or len(results) < PER_PAGE or len(observations) >= MAX_RECORDS_PER_SPECIES:
+) -> List[Tuple[int, int]]:
+    # This code path only ever needs the observation date, so records are
+    # reduced to (year, day-of-year) pairs on the spot instead of paying a
+    # full parse_observation/Observation allocation per record.
+    year_doys: List[Tuple[int, int]] = []
+    params = {
+        "taxon_id": taxon_id,
+        "place_id": WA_PLACE_ID,
+        "quality_grade": "research",
+        "iconic_taxa": "Plantae",
+        "term_id": FLOWERING_TERM_ID,
+        "term_value_id": FLOWERING_VALUE_ID,
+        "d1": d1,
+        "d2": d2,
+        "order_by": "observed_on",
+        "order": "asc",
+        "per_page": PER_PAGE,
+        "page": 1,
+    }
+    # The first page reports total_results, which bounds the page count up
+    # front; the old len(results) == PER_PAGE heuristic paid an extra empty
+    # round trip whenever a total landed on a page boundary.
+    payload = fetch_json("observations", params)
+    total = int(payload.get("total_results") or 0)
+    n_pages = min(
+        math.ceil(total / PER_PAGE),
+        math.ceil(MAX_RECORDS_PER_SPECIES / PER_PAGE),
+    )
+    for page in range(1, n_pages + 1):
+        if page > 1:
+            params["page"] = page
+            payload = fetch_json("observations", params)
+        for raw in payload.get("results", []):
+            details = raw.get("observed_on_details") or {}
+            y = details.get("year")
+            m = details.get("month")
+            d = details.get("day")
+            if not (y and m and d):
+                observed = raw.get("observed_on") or ""
+                try:
+                    y, m, d = int(observed[0:4]), int(observed[5:7]), int(observed[8:10])
+                except ValueError:
+                    continue
+            year_doys.append((y, day_of_year_ymd(y, m, d)))
+        if len(year_doys) >= MAX_RECORDS_PER_SPECIES:
             break
-        page += 1
-    return observations
-
-
-def linear_regression(xs: List[float], ys: List[float]) -> Tuple[float, float]:
-    n = len(xs)
-    if n < 2:
-        return 0.0, ys[0] if ys else 0.0
-    xbar = sum(xs) / n
-    ybar = sum(ys) / n
-    num = sum((x - xbar) * (y - ybar) for x, y in zip(xs, ys))
-    den = sum((x - xbar) ** 2 for x in xs)
-    if den == 0:
-        return 0.0, ybar
-    slope = num / den
-    intercept = ybar - slope * xbar
-    return slope, intercept
+    return year_doys
+
+
+def _fetch_year_doys(sci: str, taxon_id: int, d1: str, d2: str, cache_dir: Path) -> List[Tuple[int, int]]:
+    cached_pairs = _load_json_cache(_inat_cache_file(cache_dir, taxon_id, d1, d2))
+    if cached_pairs is not None:
+        print(f"Baseline cache hit for {sci} ({taxon_id})", flush=True)
+        return [(int(y), int(doy)) for y, doy in cached_pairs]
+    # Full observation caches written by analyze_spring.py cover the
+    # same window; reduce them to pairs rather than re-downloading.
+    cached_obs = load_observation_cache(cache_dir, taxon_id)
+    if cached_obs is not None:
+        print(f"Baseline cache hit for {sci} ({taxon_id})", flush=True)
+        return [(o.observed_on.year, day_of_year(o.observed_on)) for o in cached_obs]
+    print(f"Fetching baseline years for {sci} ({taxon_id})...", flush=True)
+    for attempt in range(1, 5):
+        try:
+            year_doys = fetch_species_observations_for_baseline(sci, taxon_id, d1=d1, d2=d2)
+            _save_json_cache(_inat_cache_file(cache_dir, taxon_id, d1, d2), year_doys)
+            return year_doys
+        except (socket.timeout, TimeoutError):
+            if attempt >= 4:
+                raise
+            delay = attempt * 3
+            print(f"  - timeout for {sci}, retrying in {delay}s...", flush=True)
+            time.sleep(delay)
+    return []
+
+
+def process_species(task: Tuple[Dict, str, str, str]) -> Tuple[str, Dict[int, float], Dict]:
+    """Pool worker: fetch one species and reduce it to yearly onsets.
+
+    Runs in a child process, so everything it needs arrives in the task
+    tuple and everything it produces comes back in the return value.
+    """
+    species, d1, d2, cache_dir_s = task
+    cache_dir = Path(cache_dir_s)
+    sci = species["species"]
+    taxon_id = int(species["taxon_id"])
+    by_year: Dict[int, List[int]] = {}
+    for yr, doy in _fetch_year_doys(sci, taxon_id, d1, d2, cache_dir):
+        by_year.setdefault(yr, []).append(doy)
+    onset_by_year: Dict[int, float] = {}
+    for y in range(int(d1[:4]), int(d2[:4]) + 1):
+        doys = by_year.get(y, [])
+        if len(doys) >= MIN_OBS_PER_YEAR:
+            onset_by_year[y] = float(percentile(doys, 0.2))
+    meta = {"taxon_id": taxon_id, "common_name": species["common_name"]}
+    return sci, onset_by_year, meta
 
 
 def fetch_herbarium_flowering_doys(
@@ -105,110 +195,74 @@ def fetch_herbarium_flowering_doys(
         "State1": state,
     }
     url = f"{HERBARIUM_BASE}?{urlencode(params)}"
-    req = Request(url, headers={"User-Agent": "wa-spring-indicator/1.0"})
-    with urlopen(req, timeout=60) as resp:
-        text = resp.read().decode("utf-8", errors="replace")
-
-    reader = csv.DictReader(io.StringIO(text), delimiter="\t")
+    req = Request(
+        url,
+        headers={"User-Agent": "wa-spring-indicator/1.0", "Accept-Encoding": "gzip"},
+    )
     doys: List[int] = []
-    for row in reader:
-        phen = (row.get("Phenology") or "").strip().lower()
-        if "flower" not in phen:
-            continue
-        try:
-            day = int((row.get("Day Collected") or "").strip())
-            month = int((row.get("Month Collected") or "").strip())
-            year = int((row.get("Year Collected") or "").strip())
-        except ValueError:
-            continue
-        if year < start_year or year > end_year:
-            continue
+    with urlopen(req, timeout=60) as resp:
+        # Parse rows straight off the socket: no whole-payload string, no
+        # per-row dict — csv.reader plus positional column indices. TSV
+        # compresses well, so gzip is negotiated and unwrapped in-stream.
+        stream = resp
+        if (resp.headers.get("Content-Encoding") or "").lower() == "gzip":
+            stream = gzip.GzipFile(fileobj=resp)
+        reader = csv.reader(
+            io.TextIOWrapper(stream, encoding="utf-8", errors="replace"),
+            delimiter="\t",
+        )
+        header = next(reader, None)
+        if not header:
+            return []
         try:
-            dt = datetime(year, month, day)
+            phen_col = header.index("Phenology")
+            day_col = header.index("Day Collected")
+            month_col = header.index("Month Collected")
+            year_col = header.index("Year Collected")
         except ValueError:
-            continue
-        doys.append(int(dt.timetuple().tm_yday))
+            return []
+        min_cols = max(phen_col, day_col, month_col, year_col) + 1
+        for row in reader:
+            if len(row) < min_cols:
+                continue
+            if "flower" not in row[phen_col].strip().lower():
+                continue
+            try:
+                day = int(row[day_col].strip())
+                month = int(row[month_col].strip())
+                year = int(row[year_col].strip())
+            except ValueError:
+                continue
+            if year < start_year or year > end_year:
+                continue
+            try:
+                # Constructor call kept purely to reject malformed herbarium
+                # dates (e.g. Feb 30); the day-of-year itself comes from the
+                # table-based helper rather than an allocated timetuple.
+                datetime(year, month, day)
+            except ValueError:
+                continue
+            doys.append(day_of_year_ymd(year, month, day))
     return doys
 
 
-def save_svg_plot(
-    out_path: Path,
-    years: List[int],
-    values: List[float],
-    slope: float,
-    intercept: float,
-    herbarium_line: Optional[float] = None,
-) -> None:
-    width, height = 980, 520
-    margin = {"l": 80, "r": 30, "t": 40, "b": 70}
-    plot_w = width - margin["l"] - margin["r"]
-    plot_h = height - margin["t"] - margin["b"]
-    bounds = values + [0.0]
-    if herbarium_line is not None:
-        bounds.append(herbarium_line)
-    y_min = min(bounds) - 3
-    y_max = max(bounds) + 3
-    if y_max <= y_min:
-        y_max = y_min + 1
-
-    def x_px(year: int) -> float:
-        if len(years) == 1:
-            return margin["l"] + plot_w / 2
-        return margin["l"] + (year - years[0]) * (plot_w / (years[-1] - years[0]))
-
-    def y_px(v: float) -> float:
-        return margin["t"] + (y_max - v) * (plot_h / (y_max - y_min))
-
-    points = " ".join(f"{x_px(y):.1f},{y_px(v):.1f}" for y, v in zip(years, values))
-    trend_points = " ".join(
-        f"{x_px(y):.1f},{y_px(intercept + slope * y):.1f}" for y in years
-    )
-    zero_y = y_px(0.0)
-    herb_y = y_px(herbarium_line) if herbarium_line is not None else None
-
-    y_ticks = 7
-    y_tick_lines = []
-    for i in range(y_ticks + 1):
-        val = y_min + i * (y_max - y_min) / y_ticks
-        py = y_px(val)
-        y_tick_lines.append(
-            f'<line x1="{margin["l"]}" y1="{py:.1f}" x2="{width-margin["r"]}" y2="{py:.1f}" '
-            f'stroke="#e7e2d8" stroke-width="1" />'
-            f'<text x="{margin["l"]-10}" y="{py+4:.1f}" text-anchor="end" font-size="12" fill="#6b746c">{val:.1f}</text>'
-        )
-
-    x_labels = []
-    for y in years:
-        px = x_px(y)
-        x_labels.append(
-            f'<text x="{px:.1f}" y="{height-30}" text-anchor="middle" font-size="12" fill="#6b746c">{y}</text>'
-        )
-
-    svg = f"""<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">
-  <rect x="0" y="0" width="{width}" height="{height}" fill="#fdfbf6"/>
-  <text x="{width/2}" y="24" text-anchor="middle" font-size="20" font-family="Georgia, serif" fill="#233529">
-    WA Baseline Trend (Species-Normalized Bloom Onset)
-  </text>
-  {''.join(y_tick_lines)}
-  <line x1="{margin["l"]}" y1="{zero_y:.1f}" x2="{width-margin["r"]}" y2="{zero_y:.1f}" stroke="#98a59b" stroke-width="1.2" />
-  <polyline fill="none" stroke="#2c6a3f" stroke-width="3" points="{points}" />
-  <polyline fill="none" stroke="#c46a3a" stroke-width="2.5" stroke-dasharray="7,5" points="{trend_points}" />
-  {f'<line x1="{margin["l"]}" y1="{herb_y:.1f}" x2="{width-margin["r"]}" y2="{herb_y:.1f}" stroke="#6b3fb0" stroke-width="2.5" stroke-dasharray="4,4" />' if herb_y is not None else ''}
-  {''.join(f'<circle cx="{x_px(y):.1f}" cy="{y_px(v):.1f}" r="4" fill="#2c6a3f"/>' for y, v in zip(years, values))}
-  <line x1="{margin["l"]}" y1="{height-margin["b"]}" x2="{width-margin["r"]}" y2="{height-margin["b"]}" stroke="#7f8b83" />
-  <line x1="{margin["l"]}" y1="{margin["t"]}" x2="{margin["l"]}" y2="{height-margin["b"]}" stroke="#7f8b83" />
-  {''.join(x_labels)}
-  <text x="{width/2}" y="{height-8}" text-anchor="middle" font-size="13" fill="#3f4c43">Year</text>
-  <text x="22" y="{height/2}" transform="rotate(-90 22,{height/2})" text-anchor="middle" font-size="13" fill="#3f4c43">
-    Mean anomaly (days, species-normalized)
-  </text>
-  <text x="{width-16}" y="{margin["t"]+18}" text-anchor="end" font-size="12" fill="#c46a3a">
-    Trend slope: {slope:.2f} days/year
-  </text>
-  {f'<text x="{width-16}" y="{margin["t"]+36}" text-anchor="end" font-size="12" fill="#6b3fb0">1950-2000 herbarium baseline: {herbarium_line:.2f} days</text>' if herbarium_line is not None else ''}
-</svg>
-"""
-    out_path.write_text(svg, encoding="utf-8")
+def _median_and_stdev(vals: List[float]) -> Tuple[float, float]:
+    # One sort and one fused traversal per species: the sorted copy yields
+    # the median directly, and sample stdev comes from a Welford
+    # accumulation over the same scan instead of statistics.stdev's
+    # separate multi-pass walk.
+    s = sorted(vals)
+    n = len(s)
+    mid = n // 2
+    med = s[mid] if n % 2 else (s[mid - 1] + s[mid]) / 2.0
+    if n < 2:
+        return med, 0.0
+    mean = m2 = 0.0
+    for i, v in enumerate(s, 1):
+        d = v - mean
+        mean += d / i
+        m2 += d * (v - mean)
+    return med, math.sqrt(m2 / (n - 1))
 
 
 def main() -> None:
@@ -226,74 +280,64 @@ def main() -> None:
 
     d1 = f"{baseline_start}-01-01"
     d2 = f"{baseline_end}-12-31"
-
+    # Same cache directory (and file format) that analyze_spring.py uses
+    # for its baseline fetches, so either script primes the other and
+    # repeat runs skip the slow network phase entirely.
+    cache_dir = root / "data" / "cache"
+
+    # Species are independent end to end (fetch, bucket, onset stats), so
+    # they fan out across a process pool. Pool size stays at
+    # INAT_FETCH_WORKERS: each worker runs one species at a time, so the
+    # pool size is also the polite concurrency cap against iNaturalist.
+    tasks = [(s, d1, d2, str(cache_dir)) for s in species_rows]
+    onsets_by_species: Dict[str, Tuple[Dict[int, float], Dict]] = {}
+    with multiprocessing.Pool(processes=min(INAT_FETCH_WORKERS, len(tasks)) or 1) as pool:
+        for sci, onset_by_year, meta in pool.imap_unordered(process_species, tasks):
+            onsets_by_species[sci] = (onset_by_year, meta)
+
+    # Results are combined in input order so downstream output stays
+    # deterministic regardless of worker completion order.
     for species in species_rows:
         sci = species["species"]
-        taxon_id = int(species["taxon_id"])
-        print(f"Fetching baseline years for {sci} ({taxon_id})...", flush=True)
-        observations = []
-        for attempt in range(1, 5):
-            try:
-                observations = fetch_species_observations_for_baseline(sci, taxon_id, d1=d1, d2=d2)
-                break
-            except (socket.timeout, TimeoutError):
-                if attempt >= 4:
-                    raise
-                delay = attempt * 3
-                print(f"  - timeout, retrying in {delay}s...", flush=True)
-                time.sleep(delay)
-        by_year: Dict[int, List[int]] = {}
-        for obs in observations:
-            yr = obs.observed_on.year
-            by_year.setdefault(yr, []).append(obs.observed_on.timetuple().tm_yday)
-
-        onset_by_year: Dict[int, float] = {}
-        for y in baseline_years:
-            doys = by_year.get(y, [])
-            if len(doys) >= MIN_OBS_PER_YEAR:
-                onset_by_year[y] = float(percentile(doys, 0.2))
+        onset_by_year, meta = onsets_by_species[sci]
         if len(onset_by_year) >= 5:
             per_species_year_onset[sci] = onset_by_year
-            species_meta[sci] = {
-                "taxon_id": taxon_id,
-                "common_name": species["common_name"],
-            }
+            species_meta[sci] = meta
 
-    # Normalize by species median onset over baseline period.
-    normalized_rows = []
+    # Normalize by species median onset over baseline period. Rows are
+    # plain tuples in CSV column order: cheaper to build than per-row
+    # dicts, and rounding is deferred to write time so the aggregation
+    # below runs on full-precision values.
+    normalized_rows: List[Tuple] = []
     for sci, yearly in per_species_year_onset.items():
-        vals = [yearly[y] for y in sorted(yearly)]
-        med = median(vals)
-        sd = stdev(vals) if len(vals) > 1 else 0.0
+        med, sd = _median_and_stdev(list(yearly.values()))
+        meta = species_meta[sci]
         for y, onset in yearly.items():
             anomaly = onset - med
             z = (anomaly / sd) if sd > 0 else 0.0
             normalized_rows.append(
-                {
-                    "species": sci,
-                    "common_name": species_meta[sci]["common_name"],
-                    "taxon_id": species_meta[sci]["taxon_id"],
-                    "year": y,
-                    "onset_doy": round(onset, 3),
-                    "species_median_doy": round(med, 3),
-                    "anomaly_days": round(anomaly, 3),
-                    "zscore": round(z, 3),
-                }
+                (sci, meta["common_name"], meta["taxon_id"], y, onset, med, anomaly, z)
             )
 
-    # Aggregate by year.
+    # Aggregate by year in a single pass over normalized_rows instead of
+    # re-filtering the whole list once per baseline year.
+    year_totals: Dict[int, List[float]] = {}
+    for row in normalized_rows:
+        totals = year_totals.setdefault(row[3], [0.0, 0.0, 0])
+        totals[0] += row[6]
+        totals[1] += row[7]
+        totals[2] += 1
     agg_by_year = {}
     for y in baseline_years:
-        rows = [r for r in normalized_rows if r["year"] == y]
-        if not rows:
+        totals = year_totals.get(y)
+        if not totals:
             continue
-        mean_anom = sum(r["anomaly_days"] for r in rows) / len(rows)
-        mean_z = sum(r["zscore"] for r in rows) / len(rows)
+        anom_sum, z_sum, count = totals
         agg_by_year[y] = {
             "year": y,
-            "species_count": len(rows),
-            "mean_normalized_anomaly_days": round(mean_anom, 3),
-            "mean_zscore": round(mean_z, 3),
+            "species_count": int(count),
+            "mean_normalized_anomaly_days": round(anom_sum / count, 3),
+            "mean_zscore": round(z_sum / count, 3),
         }
 
     agg_years = sorted(agg_by_year)
@@ -303,48 +347,58 @@ def main() -> None:
     # Herbarium (1950-2000) baseline in comparable anomaly units:
     # species-level herbarium onset (20th percentile DOY, flowering only)
     # minus iNaturalist 2017-2025 species median onset.
+    # percentile(.., 0.5) is an exact median and uses the selection-based
+    # path from analyze_spring instead of statistics.median's full sort.
     species_recent_medians = {
-        sci: median([per_species_year_onset[sci][y] for y in per_species_year_onset[sci]])
-        for sci in per_species_year_onset
+        sci: percentile(list(yearly.values()), 0.5)
+        for sci, yearly in per_species_year_onset.items()
     }
-    herbarium_rows = []
-    for sci in per_species_year_onset:
+    def fetch_herbarium(sci: str) -> Tuple[str, List[int]]:
+        cache_file = _herbarium_cache_file(cache_dir, sci, 1950, 2000)
+        cached = _load_json_cache(cache_file)
+        if cached is not None:
+            return sci, cached
         for attempt in range(1, 5):
             try:
-                herb_doys = fetch_herbarium_flowering_doys(sci, start_year=1950, end_year=2000)
-                break
+                doys = fetch_herbarium_flowering_doys(sci, start_year=1950, end_year=2000)
+                _save_json_cache(cache_file, doys)
+                return sci, doys
             except (socket.timeout, TimeoutError):
                 if attempt >= 4:
                     raise
                 delay = attempt * 3
                 print(f"  - herbarium timeout for {sci}, retrying in {delay}s...", flush=True)
                 time.sleep(delay)
-        else:
-            herb_doys = []
+        return sci, []
+
+    herb_doys_by_species: Dict[str, List[int]] = {}
+    with ThreadPoolExecutor(max_workers=HERBARIUM_FETCH_WORKERS) as executor:
+        futures = [executor.submit(fetch_herbarium, sci) for sci in per_species_year_onset]
+        for future in as_completed(futures):
+            sci, herb_doys = future.result()
+            herb_doys_by_species[sci] = herb_doys
+
+    herbarium_rows: List[Tuple] = []
+    for sci in per_species_year_onset:
+        herb_doys = herb_doys_by_species[sci]
         if len(herb_doys) < 5:
             continue
         herb_onset = float(percentile(herb_doys, 0.2))
-        anomaly = herb_onset - float(species_recent_medians[sci])
+        recent_median = float(species_recent_medians[sci])
+        anomaly = herb_onset - recent_median
+        meta = species_meta[sci]
         herbarium_rows.append(
-            {
-                "species": sci,
-                "common_name": species_meta[sci]["common_name"],
-                "taxon_id": species_meta[sci]["taxon_id"],
-                "herbarium_flowering_obs_1950_2000": len(herb_doys),
-                "herbarium_onset_doy_20pct": round(herb_onset, 3),
-                "inat_2017_2025_median_onset_doy": round(float(species_recent_medians[sci]), 3),
-                "comparable_anomaly_days": round(anomaly, 3),
-            }
+            (sci, meta["common_name"], meta["taxon_id"], len(herb_doys), herb_onset, recent_median, anomaly)
         )
     herbarium_line = None
     if herbarium_rows:
-        herbarium_line = sum(r["comparable_anomaly_days"] for r in herbarium_rows) / len(herbarium_rows)
+        herbarium_line = sum(row[6] for row in herbarium_rows) / len(herbarium_rows)
 
     out_csv = root / "data" / "baseline_normalized_onsets.csv"
     with out_csv.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
+        writer = csv.writer(f)
+        writer.writerow(
+            [
                 "species",
                 "common_name",
                 "taxon_id",
@@ -353,10 +407,12 @@ def main() -> None:
                 "species_median_doy",
                 "anomaly_days",
                 "zscore",
-            ],
+            ]
+        )
+        writer.writerows(
+            (sci, common, taxon, y, f"{onset:.3f}", f"{med:.3f}", f"{anom:.3f}", f"{z:.3f}")
+            for sci, common, taxon, y, onset, med, anom, z in sorted(normalized_rows)
         )
-        writer.writeheader()
-        writer.writerows(sorted(normalized_rows, key=lambda r: (r["species"], r["year"])))
 
     out_summary = root / "data" / "baseline_trend_summary.json"
     summary = {
@@ -378,9 +434,9 @@ def main() -> None:
 
     out_herbarium_csv = root / "data" / "herbarium_1950_2000_comparison.csv"
     with out_herbarium_csv.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
+        writer = csv.writer(f)
+        writer.writerow(
+            [
                 "species",
                 "common_name",
                 "taxon_id",
@@ -388,19 +444,28 @@ def main() -> None:
                 "herbarium_onset_doy_20pct",
                 "inat_2017_2025_median_onset_doy",
                 "comparable_anomaly_days",
-            ],
+            ]
+        )
+        writer.writerows(
+            (sci, common, taxon, n_obs, f"{onset:.3f}", f"{recent:.3f}", f"{anom:.3f}")
+            for sci, common, taxon, n_obs, onset, recent, anom in sorted(herbarium_rows)
         )
-        writer.writeheader()
-        writer.writerows(sorted(herbarium_rows, key=lambda r: r["species"]))
 
     out_svg = root / "data" / "baseline_trend.svg"
-    save_svg_plot(
+    render_trend_svg(
         out_svg,
         agg_years,
         agg_vals,
-        slope=slope,
-        intercept=intercept,
-        herbarium_line=herbarium_line,
+        slope,
+        intercept,
+        title="WA Baseline Trend (Species-Normalized Bloom Onset)",
+        ylabel="Mean anomaly (days, species-normalized)",
+        extra_line=herbarium_line,
+        extra_line_label=(
+            f"1950-2000 herbarium baseline: {herbarium_line:.2f} days"
+            if herbarium_line is not None
+            else None
+        ),
     )
 
     print(f"Wrote {out_csv}")